@@ -247,7 +247,7 @@ class RemoteObjectDetector:
         result = self.event.wait(timeout=10.0)
 
         # if it timed out
-        if result is None:
+        if not result:
             return detections
 
         for d in self.out_np_shm:
@@ -435,21 +435,14 @@ def latest_frame(camera_name):
     resize_quality = request.args.get("quality", default=70, type=int)
 
     if camera_name in current_app.frigate_config.cameras:
-        frame = current_app.detected_frames_processor.get_current_frame(
-            camera_name, draw_options
+        jpg_bytes = latest_jpg_bytes(
+            current_app.detected_frames_processor,
+            camera_name,
+            draw_options,
+            height=request.args.get("h", type=int),
+            quality=resize_quality,
         )
-        if frame is None:
-            frame = np.zeros((720, 1280, 3), np.uint8)
-
-        height = int(request.args.get("h", str(frame.shape[0])))
-        width = int(height * frame.shape[1] / frame.shape[0])
-
-        frame = cv2.resize(frame, dsize=(width, height), interpolation=cv2.INTER_AREA)
-
-        ret, jpg = cv2.imencode(
-            ".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), resize_quality]
-        )
-        response = make_response(jpg.tobytes())
+        response = make_response(jpg_bytes)
         response.headers["Content-Type"] = "image/jpeg"
         return response
     else:
@@ -746,19 +739,60 @@ def vod_event(id):
     )
 
 
+# most recent encoded frame for each camera, so concurrent pollers of the
+# same frame share a single render/resize/encode
+jpg_frame_cache = {}
+
+
+def latest_jpg_bytes(
+    detected_frames_processor,
+    camera_name,
+    draw_options,
+    height=None,
+    quality=70,
+    interpolation=cv2.INTER_AREA,
+):
+    camera_state = detected_frames_processor.camera_states[camera_name]
+    params = (
+        tuple(sorted((k, bool(v)) for k, v in draw_options.items())),
+        height,
+        quality,
+        interpolation,
+    )
+    frame_time = camera_state.current_frame_time
+    cached = jpg_frame_cache.get(camera_name)
+    if cached is not None and cached[0] == params and cached[1] == frame_time:
+        return cached[2]
+
+    frame = camera_state.get_current_frame(draw_options)
+    if frame is None:
+        frame = np.zeros((720, 1280, 3), np.uint8)
+
+    if height is None:
+        height = frame.shape[0]
+    width = int(height * frame.shape[1] / frame.shape[0])
+    frame = cv2.resize(frame, dsize=(width, height), interpolation=interpolation)
+
+    ret, jpg = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+    jpg_bytes = jpg.tobytes()
+    jpg_frame_cache[camera_name] = (params, frame_time, jpg_bytes)
+    return jpg_bytes
+
+
 def imagestream(detected_frames_processor, camera_name, fps, height, draw_options):
     while True:
         # max out at specified FPS
         time.sleep(1 / fps)
-        frame = detected_frames_processor.get_current_frame(camera_name, draw_options)
-        if frame is None:
-            frame = np.zeros((height, int(height * 16 / 9), 3), np.uint8)
-
-        width = int(height * frame.shape[1] / frame.shape[0])
-        frame = cv2.resize(frame, dsize=(width, height), interpolation=cv2.INTER_LINEAR)
-
-        ret, jpg = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 70])
-        yield (
-            b"--frame\r\n"
-            b"Content-Type: image/jpeg\r\n\r\n" + jpg.tobytes() + b"\r\n\r\n"
+        jpg_bytes = latest_jpg_bytes(
+            detected_frames_processor,
+            camera_name,
+            draw_options,
+            height=height,
+            quality=70,
+            interpolation=cv2.INTER_LINEAR,
         )
+        # yield the jpeg without concatenating it into a new bytes object,
+        # since the encoded frame may be served to many viewers
+        yield b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+        yield jpg_bytes
+        yield b"\r\n\r\n"
@@ -22,7 +22,7 @@ class MotionDetector:
             dsize=(self.motion_frame_size[1], self.motion_frame_size[0]),
             interpolation=cv2.INTER_LINEAR,
         )
-        self.mask = np.where(resized_mask == [0])
+        self.mask = np.where(resized_mask == 0)
         self.save_images = False
 
     def detect(self, frame):
@@ -49,7 +49,7 @@ class MotionDetector:
                 ).astype(np.uint8)
 
         # mask frame
-        resized_frame[self.mask] = [255]
+        resized_frame[self.mask] = 255
 
         # it takes ~30 frames to establish a baseline
         # dont bother looking for motion
@@ -9,7 +9,7 @@ import os
 import queue
 import threading
 import time
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from statistics import mean, median
 from typing import Callable, Dict
 
@@ -24,6 +24,7 @@ from frigate.util import (
     draw_box_with_label,
     draw_timestamp,
     load_labels,
+    yuv_crop_and_resize,
 )
 
 logger = logging.getLogger(__name__)
@@ -82,8 +83,8 @@ class TrackedObject:
         self.frame = None
         self.previous = self.to_dict()
 
-        # start the score history
-        self.score_history = [self.obj_data["score"]]
+        # start the score history, the bounded deque only keeps the last 10 scores
+        self.score_history = deque([self.obj_data["score"]], maxlen=10)
 
     def _is_false_positive(self):
         # once a true positive, always a true positive
@@ -94,7 +95,7 @@ class TrackedObject:
         return self.computed_score < threshold
 
     def compute_score(self):
-        scores = self.score_history[:]
+        scores = list(self.score_history)
         # pad with zeros if you dont have at least 3 scores
         if len(scores) < 3:
             scores += [0.0] * (3 - len(scores))
@@ -108,9 +109,6 @@ class TrackedObject:
             self.score_history.append(0.0)
         else:
             self.score_history.append(obj_data["score"])
-        # only keep the last 10 scores
-        if len(self.score_history) > 10:
-            self.score_history = self.score_history[-10:]
 
         # calculate if this is a false positive
         self.computed_score = self.compute_score()
@@ -209,12 +207,6 @@ class TrackedObject:
         return event
 
     def get_thumbnail(self):
-        if (
-            self.thumbnail_data is None
-            or self.thumbnail_data["frame_time"] not in self.frame_cache
-        ):
-            ret, jpg = cv2.imencode(".jpg", np.zeros((175, 175, 3), np.uint8))
-
         jpg_bytes = self.get_jpg_bytes(
             timestamp=False, bounding_box=False, crop=True, height=175
         )
@@ -253,16 +245,35 @@ class TrackedObject:
             return None
 
         try:
-            best_frame = cv2.cvtColor(
-                self.frame_cache[self.thumbnail_data["frame_time"]],
-                cv2.COLOR_YUV2BGR_I420,
-            )
+            yuv_frame = self.frame_cache[self.thumbnail_data["frame_time"]]
         except KeyError:
             logger.warning(
                 f"Unable to create jpg because frame {self.thumbnail_data['frame_time']} is not in the cache"
             )
             return None
 
+        if crop:
+            box = self.thumbnail_data["box"]
+            box_size = 300
+            region = calculate_region(
+                self.camera_config.frame_shape,
+                box[0],
+                box[1],
+                box[2],
+                box[3],
+                box_size,
+                multiplier=1.1,
+            )
+            # only convert the cropped portion of the yuv frame instead of
+            # paying for a full frame colorspace conversion and cropping after
+            best_frame = cv2.cvtColor(
+                yuv_crop_and_resize(yuv_frame, region), cv2.COLOR_YUV2BGR_I420
+            )
+            x_offset, y_offset = region[0], region[1]
+        else:
+            best_frame = cv2.cvtColor(yuv_frame, cv2.COLOR_YUV2BGR_I420)
+            x_offset, y_offset = 0, 0
+
         if bounding_box:
             thickness = 2
             color = self.colormap[self.obj_data["label"]]
@@ -271,30 +282,16 @@ class TrackedObject:
             box = self.thumbnail_data["box"]
             draw_box_with_label(
                 best_frame,
-                box[0],
-                box[1],
-                box[2],
-                box[3],
+                box[0] - x_offset,
+                box[1] - y_offset,
+                box[2] - x_offset,
+                box[3] - y_offset,
                 self.obj_data["label"],
                 f"{int(self.thumbnail_data['score']*100)}% {int(self.thumbnail_data['area'])}",
                 thickness=thickness,
                 color=color,
             )
 
-        if crop:
-            box = self.thumbnail_data["box"]
-            box_size = 300
-            region = calculate_region(
-                best_frame.shape,
-                box[0],
-                box[1],
-                box[2],
-                box[3],
-                box_size,
-                multiplier=1.1,
-            )
-            best_frame = best_frame[region[1] : region[3], region[0] : region[2]]
-
         if height:
             width = int(height * best_frame.shape[1] / best_frame.shape[0])
             best_frame = cv2.resize(
@@ -361,20 +358,41 @@ class CameraState:
         self._current_frame = np.zeros(self.camera_config.frame_shape_yuv, np.uint8)
         self.current_frame_lock = threading.Lock()
         self.current_frame_time = 0.0
+        # (render key, frame) of the last rendered frame
+        self._cached_render = (None, None)
+        # the motion mask never changes, so the pixel coordinates it
+        # blacks out can be computed once instead of per render
+        self._mask_overlay = np.where(self.camera_config.motion.mask == 0)
         self.motion_boxes = []
         self.regions = []
         self.previous_frame_id = None
         self.callbacks = defaultdict(list)
 
     def get_current_frame(self, draw_options={}):
+        # everything drawn on the frame only changes when a new frame
+        # arrives, so rendering can be reused across pollers asking for
+        # the same frame with the same options
+        render_key = (
+            self.current_frame_time,
+            tuple(sorted((k, bool(v)) for k, v in draw_options.items())),
+        )
+        cached_key, cached_frame = self._cached_render
+        if cached_key == render_key:
+            return cached_frame
+
         with self.current_frame_lock:
-            frame_copy = np.copy(self._current_frame)
+            # the colorspace conversion doubles as the copy out of the shared
+            # frame, which saves a full pass over the yuv frame compared to
+            # copying first and converting after
+            frame_copy = cv2.cvtColor(self._current_frame, cv2.COLOR_YUV2BGR_I420)
             frame_time = self.current_frame_time
-            tracked_objects = {k: v.to_dict() for k, v in self.tracked_objects.items()}
+            tracked_objects = self.tracked_objects
             motion_boxes = self.motion_boxes.copy()
             regions = self.regions.copy()
 
-        frame_copy = cv2.cvtColor(frame_copy, cv2.COLOR_YUV2BGR_I420)
+        # update() replaces the tracked objects dict wholesale, so the
+        # snapshot above stays consistent while building outside the lock
+        tracked_objects = {k: v.to_dict() for k, v in tracked_objects.items()}
         # draw on the frame
         if draw_options.get("bounding_boxes"):
             # draw the bounding boxes on the frame
@@ -422,8 +440,7 @@ class CameraState:
                 cv2.drawContours(frame_copy, [zone.contour], -1, zone.color, thickness)
 
         if draw_options.get("mask"):
-            mask_overlay = np.where(self.camera_config.motion.mask == [0])
-            frame_copy[mask_overlay] = [0, 0, 0]
+            frame_copy[self._mask_overlay] = [0, 0, 0]
 
         if draw_options.get("motion_boxes"):
             for m_box in motion_boxes:
@@ -447,6 +464,7 @@ class CameraState:
                 position=self.camera_config.timestamp_style.position,
             )
 
+        self._cached_render = ((frame_time, render_key[1]), frame_copy)
         return frame_copy
 
     def finished(self, obj_id):
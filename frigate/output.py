@@ -1,4 +1,3 @@
-import datetime
 import glob
 import logging
 import math
@@ -7,6 +6,7 @@ import queue
 import signal
 import subprocess as sp
 import threading
+import time
 from multiprocessing import shared_memory
 from wsgiref.simple_server import make_server
 
@@ -307,7 +307,8 @@ class BirdsEyeFrameManager:
         if self.camera_active(object_count, motion_count):
             self.cameras[camera]["last_active_frame"] = frame_time
 
-        now = datetime.datetime.now().timestamp()
+        # monotonic, so a system clock jump can't stall or flood the output
+        now = time.monotonic()
 
         # limit output to 10 fps
         if (now - self.last_output_time) < 1 / 10:
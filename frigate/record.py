@@ -10,7 +10,7 @@ import string
 import subprocess as sp
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 
 import psutil
@@ -51,7 +51,7 @@ class RecordingMaintainer(threading.Thread):
         self.config = config
         self.recordings_info_queue = recordings_info_queue
         self.stop_event = stop_event
-        self.recordings_info = defaultdict(list)
+        self.recordings_info = defaultdict(deque)
         self.end_time_cache = {}
 
     def move_files(self):
@@ -115,7 +115,7 @@ class RecordingMaintainer(threading.Thread):
                 and self.recordings_info[camera][0][0]
                 < recordings[0]["start_time"].timestamp()
             ):
-                self.recordings_info[camera].pop(0)
+                self.recordings_info[camera].popleft()
 
             # get all events with the end time after the start of the oldest cache file
             # or with end_time None
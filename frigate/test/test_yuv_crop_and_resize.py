@@ -0,0 +1,61 @@
+import cv2
+import numpy as np
+from unittest import TestCase, main
+from frigate.util import yuv_crop_and_resize
+
+
+class TestYuvCropAndResize(TestCase):
+    def setUp(self):
+        # a uniform color makes each yuv plane a single value, so
+        # every output pixel is either a copied value or padding
+        self.bgr_frame = np.zeros((100, 200, 3), np.uint8)
+        self.bgr_frame[:] = (60, 120, 180)
+        self.yuv_frame = cv2.cvtColor(self.bgr_frame, cv2.COLOR_BGR2YUV_I420)
+        self.y_value = self.yuv_frame[0, 0]
+        self.u_value = self.yuv_frame[100, 0]
+        self.v_value = self.yuv_frame[125, 0]
+
+    def test_interior_region_fully_covered(self):
+        # a region fully inside the frame should produce exactly the copied
+        # planes with no padding anywhere
+        cropped = yuv_crop_and_resize(self.yuv_frame, (10, 10, 58, 58))
+
+        expected = np.zeros((72, 48), np.uint8)
+        expected[0:48] = self.y_value
+        expected[48:60] = self.u_value
+        expected[60:72] = self.v_value
+        assert np.array_equal(cropped, expected)
+
+    def test_region_past_left_edge(self):
+        cropped = yuv_crop_and_resize(self.yuv_frame, (-20, 10, 28, 58))
+        # the uncovered left side gets black padding
+        assert np.all(cropped[0:48, 0:20] == 16)
+        assert np.all(cropped[48:72, 0:10] == 128)
+        # the copied area is still the frame
+        assert np.all(cropped[0:48, 20:48] == self.y_value)
+
+    def test_region_past_top_edge(self):
+        cropped = yuv_crop_and_resize(self.yuv_frame, (10, -20, 58, 28))
+        assert np.all(cropped[0:20] == 16)
+        assert np.all(cropped[48:53] == 128)
+        assert np.all(cropped[60:65] == 128)
+        assert np.all(cropped[20:48] == self.y_value)
+        assert np.all(cropped[53:60] == self.u_value)
+        assert np.all(cropped[65:72] == self.v_value)
+
+    def test_region_past_right_edge(self):
+        cropped = yuv_crop_and_resize(self.yuv_frame, (160, 10, 208, 58))
+        assert np.all(cropped[0:48, 40:48] == 16)
+        assert np.all(cropped[48:60, 20:24] == 128)
+        assert np.all(cropped[0:48, 0:40] == self.y_value)
+
+    def test_region_past_bottom_edge(self):
+        cropped = yuv_crop_and_resize(self.yuv_frame, (10, 60, 58, 108))
+        assert np.all(cropped[40:48] == 16)
+        assert np.all(cropped[58:60] == 128)
+        assert np.all(cropped[70:72] == 128)
+        assert np.all(cropped[0:40] == self.y_value)
+
+
+if __name__ == "__main__":
+    main(verbosity=2)
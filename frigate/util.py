@@ -34,7 +34,7 @@ def deep_merge(dct1: dict, dct2: dict, override=False, merge_lists=False) -> dic
     for k, v2 in dct2.items():
         if k in merged:
             v1 = merged[k]
-            if isinstance(v1, dict) and isinstance(v2, collections.Mapping):
+            if isinstance(v1, dict) and isinstance(v2, collections.abc.Mapping):
                 merged[k] = deep_merge(v1, v2, override)
             elif isinstance(v1, list) and isinstance(v2, list):
                 if merge_lists:
@@ -293,10 +293,20 @@ def yuv_crop_and_resize(frame, region, height=None):
     # make sure the size is a multiple of 4
     # TODO: this should be based on the size after resize now
     size = (region[3] - region[1]) // 4 * 4
-    yuv_cropped_frame = np.zeros((size + size // 2, size), np.uint8)
-    # fill in black
-    yuv_cropped_frame[:] = 128
-    yuv_cropped_frame[0:size, 0:size] = 16
+    yuv_cropped_frame = np.empty((size + size // 2, size), np.uint8)
+
+    # when the copied channels fully cover the output there is nothing to
+    # pad, so skip the black fill; a full y channel implies full uv
+    # channels since their dimensions are derived from it
+    if not (
+        y_channel_x_offset == 0
+        and y_channel_y_offset == 0
+        and y[2] - y[0] == size
+        and y[3] - y[1] == size
+    ):
+        # fill in black
+        yuv_cropped_frame[:] = 128
+        yuv_cropped_frame[0:size, 0:size] = 16
 
     # copy the y channel
     yuv_cropped_frame[
@@ -547,32 +557,34 @@ def restart_frigate():
 class EventsPerSecond:
     def __init__(self, max_events=1000):
         self._start = None
-        self._max_events = max_events
-        self._timestamps = []
+        self._timestamps = collections.deque(maxlen=max_events)
 
     def start(self):
-        self._start = datetime.datetime.now().timestamp()
+        # monotonic is immune to system clock adjustments and cheaper
+        # than datetime.now() on these hot paths
+        self._start = time.monotonic()
 
     def update(self):
         if self._start is None:
             self.start()
-        self._timestamps.append(datetime.datetime.now().timestamp())
-        # truncate the list when it goes 100 over the max_size
-        if len(self._timestamps) > self._max_events + 100:
-            self._timestamps = self._timestamps[(1 - self._max_events) :]
+        # the deque is bounded, so old events are evicted implicitly
+        self._timestamps.append(time.monotonic())
 
     def eps(self, last_n_seconds=10):
         if self._start is None:
             self.start()
         # compute the (approximate) events in the last n seconds
-        now = datetime.datetime.now().timestamp()
+        now = time.monotonic()
+        # drop expired events from the front instead of scanning the
+        # full history on every call
+        expire_before = now - last_n_seconds
+        while self._timestamps and self._timestamps[0] <= expire_before:
+            self._timestamps.popleft()
         seconds = min(now - self._start, last_n_seconds)
         # avoid divide by zero
         if seconds == 0:
             seconds = 1
-        return (
-            len([t for t in self._timestamps if t > (now - last_n_seconds)]) / seconds
-        )
+        return len(self._timestamps) / seconds
 
 
 def print_stack(sig, frame):
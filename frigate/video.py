@@ -8,11 +8,11 @@ import signal
 import subprocess as sp
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from typing import Dict, List
 
 import numpy as np
-from cv2 import cv2, reduce
+import cv2
 from setproctitle import setproctitle
 
 from frigate.config import CameraConfig, DetectConfig
@@ -35,44 +35,10 @@ from frigate.util import (
 
 logger = logging.getLogger(__name__)
 
-
-def filtered(obj, objects_to_track, object_filters):
-    object_name = obj[0]
-
-    if not object_name in objects_to_track:
-        return True
-
-    if object_name in object_filters:
-        obj_settings = object_filters[object_name]
-
-        # if the min area is larger than the
-        # detected object, don't add it to detected objects
-        if obj_settings.min_area > obj[3]:
-            return True
-
-        # if the detected object is larger than the
-        # max area, don't add it to detected objects
-        if obj_settings.max_area < obj[3]:
-            return True
-
-        # if the score is lower than the min_score, skip
-        if obj_settings.min_score > obj[1]:
-            return True
-
-        if not obj_settings.mask is None:
-            # compute the coordinates of the object and make sure
-            # the location isnt outside the bounds of the image (can happen from rounding)
-            y_location = min(int(obj[2][3]), len(obj_settings.mask) - 1)
-            x_location = min(
-                int((obj[2][2] - obj[2][0]) / 2.0) + obj[2][0],
-                len(obj_settings.mask[0]) - 1,
-            )
-
-            # if the object is in a masked location, don't add it to detected objects
-            if obj_settings.mask[y_location][x_location] == 0:
-                return True
-
-    return False
+# flattened copy of an object filter config used on the detection hot path
+ObjectFilterSettings = namedtuple(
+    "ObjectFilterSettings", ["min_area", "max_area", "min_score", "threshold", "mask"]
+)
 
 
 def create_tensor_input(frame, model_shape, region):
@@ -121,7 +87,10 @@ def start_or_restart_ffmpeg(
             stdout=sp.PIPE,
             stderr=logpipe,
             stdin=sp.DEVNULL,
-            bufsize=frame_size * 10,
+            # keep the reader buffer smaller than a frame so readinto
+            # bypasses it and reads from the pipe straight into the
+            # shared memory buffer instead of staging frames in between
+            bufsize=frame_size // 2,
             start_new_session=True,
         )
     return process
@@ -136,6 +105,7 @@ def capture_frames(
     fps: mp.Value,
     skipped_fps: mp.Value,
     current_frame: mp.Value,
+    frame_counter: mp.Value,
 ):
 
     frame_size = frame_shape[0] * frame_shape[1]
@@ -143,27 +113,64 @@ def capture_frames(
     frame_rate.start()
     skipped_eps = EventsPerSecond()
     skipped_eps.start()
+    # scratch buffer for frames that wont be kept so skipped frames
+    # never touch the shared memory store
+    skipped_frame_buffer = bytearray(frame_size)
     while True:
         fps.value = frame_rate.eps()
-        skipped_fps = skipped_eps.eps()
+        skipped_fps.value = skipped_eps.eps()
+
+        # if the queue is already full, drain the frame from the pipe
+        # into the scratch buffer and skip it without ever creating a
+        # shared memory segment for it
+        if frame_queue.full():
+            try:
+                if (
+                    ffmpeg_process.stdout.readinto(skipped_frame_buffer)
+                    != frame_size
+                ):
+                    raise BrokenPipeError("unable to read a full frame")
+            except Exception as e:
+                logger.error(
+                    f"{camera_name}: Unable to read frames from ffmpeg process."
+                )
+
+                if ffmpeg_process.poll() != None:
+                    logger.error(
+                        f"{camera_name}: ffmpeg process is not running. exiting capture thread..."
+                    )
+                    break
+                continue
+
+            frame_rate.update()
+            skipped_eps.update()
+            frame_counter.value += 1
+            continue
 
         current_frame.value = datetime.datetime.now().timestamp()
         frame_name = f"{camera_name}{current_frame.value}"
         frame_buffer = frame_manager.create(frame_name, frame_size)
         try:
-            frame_buffer[:] = ffmpeg_process.stdout.read(frame_size)
+            # read the frame from ffmpeg directly into the shared memory buffer
+            # to avoid materializing an intermediate bytes object and copying it
+            if ffmpeg_process.stdout.readinto(frame_buffer) != frame_size:
+                raise BrokenPipeError("unable to read a full frame")
         except Exception as e:
             logger.error(f"{camera_name}: Unable to read frames from ffmpeg process.")
 
+            # the segment is no longer needed, remove it from
+            # the store so it doesnt leak in /dev/shm
+            frame_manager.delete(frame_name)
+
             if ffmpeg_process.poll() != None:
                 logger.error(
                     f"{camera_name}: ffmpeg process is not running. exiting capture thread..."
                 )
-                frame_manager.delete(frame_name)
                 break
             continue
 
         frame_rate.update()
+        frame_counter.value += 1
 
         # if the queue is full, skip this frame
         if frame_queue.full():
@@ -180,7 +187,14 @@ def capture_frames(
 
 class CameraWatchdog(threading.Thread):
     def __init__(
-        self, camera_name, config, frame_queue, camera_fps, ffmpeg_pid, stop_event
+        self,
+        camera_name,
+        config,
+        frame_queue,
+        camera_fps,
+        skipped_fps,
+        ffmpeg_pid,
+        stop_event,
     ):
         threading.Thread.__init__(self)
         self.logger = logging.getLogger(f"watchdog.{camera_name}")
@@ -191,6 +205,7 @@ class CameraWatchdog(threading.Thread):
         self.logpipe = LogPipe(f"ffmpeg.{self.camera_name}.detect", logging.ERROR)
         self.ffmpeg_other_processes = []
         self.camera_fps = camera_fps
+        self.skipped_fps = skipped_fps
         self.ffmpeg_pid = ffmpeg_pid
         self.frame_queue = frame_queue
         self.frame_shape = self.config.frame_shape_yuv
@@ -217,7 +232,7 @@ class CameraWatchdog(threading.Thread):
 
         time.sleep(10)
         while not self.stop_event.wait(10):
-            now = datetime.datetime.now().timestamp()
+            now = time.monotonic()
 
             if not self.capture_thread.is_alive():
                 self.logger.error(
@@ -228,7 +243,11 @@ class CameraWatchdog(threading.Thread):
                 )
                 self.logpipe.dump()
                 self.start_ffmpeg_detect()
-            elif now - self.capture_thread.current_frame.value > 20:
+            elif self.capture_thread.frame_counter.value != self.last_frame_counter:
+                # the capture thread is still producing frames
+                self.last_frame_counter = self.capture_thread.frame_counter.value
+                self.last_frame_change = now
+            elif now - self.last_frame_change > 20:
                 self.logger.info(
                     f"No frames received from {self.camera_name} in 20 seconds. Exiting ffmpeg..."
                 )
@@ -264,32 +283,38 @@ class CameraWatchdog(threading.Thread):
             ffmpeg_cmd, self.logger, self.logpipe, self.frame_size
         )
         self.ffmpeg_pid.value = self.ffmpeg_detect_process.pid
+        # the new capture thread starts with a fresh frame counter
+        self.last_frame_counter = -1
+        self.last_frame_change = time.monotonic()
         self.capture_thread = CameraCapture(
             self.camera_name,
             self.ffmpeg_detect_process,
             self.frame_shape,
             self.frame_queue,
             self.camera_fps,
+            self.skipped_fps,
         )
         self.capture_thread.start()
 
 
 class CameraCapture(threading.Thread):
-    def __init__(self, camera_name, ffmpeg_process, frame_shape, frame_queue, fps):
+    def __init__(
+        self, camera_name, ffmpeg_process, frame_shape, frame_queue, fps, skipped_fps
+    ):
         threading.Thread.__init__(self)
         self.name = f"capture:{camera_name}"
         self.camera_name = camera_name
         self.frame_shape = frame_shape
         self.frame_queue = frame_queue
         self.fps = fps
-        self.skipped_fps = EventsPerSecond()
+        self.skipped_fps = skipped_fps
         self.frame_manager = SharedMemoryFrameManager()
         self.ffmpeg_process = ffmpeg_process
         self.current_frame = mp.Value("d", 0.0)
+        self.frame_counter = mp.Value("Q", 0)
         self.last_frame = 0
 
     def run(self):
-        self.skipped_fps.start()
         capture_frames(
             self.ffmpeg_process,
             self.camera_name,
@@ -299,6 +324,7 @@ class CameraCapture(threading.Thread):
             self.fps,
             self.skipped_fps,
             self.current_frame,
+            self.frame_counter,
         )
 
 
@@ -317,6 +343,7 @@ def capture_camera(name, config: CameraConfig, process_info):
         config,
         frame_queue,
         process_info["camera_fps"],
+        process_info["skipped_fps"],
         process_info["ffmpeg_pid"],
         stop_event,
     )
@@ -351,7 +378,20 @@ def track_camera(
 
     frame_shape = config.frame_shape
     objects_to_track = config.objects.track
-    object_filters = config.objects.filters
+
+    # flatten the merged filter configs into plain tuples once so the
+    # per-detection filter checks are simple attribute reads instead of
+    # pydantic model lookups
+    object_filters = {
+        name: ObjectFilterSettings(
+            filter_config.min_area,
+            filter_config.max_area,
+            filter_config.min_score,
+            filter_config.threshold,
+            filter_config.mask,
+        )
+        for name, filter_config in config.objects.filters.items()
+    }
 
     motion_detector = MotionDetector(frame_shape, config.motion)
     object_detector = RemoteObjectDetector(
@@ -422,24 +462,63 @@ def detect(
 
     detections = []
     region_detections = object_detector.detect(tensor_input)
-    for d in region_detections:
-        box = d[2]
-        size = region[2] - region[0]
-        x_min = int((box[1] * size) + region[0])
-        y_min = int((box[0] * size) + region[1])
-        x_max = int((box[3] * size) + region[0])
-        y_max = int((box[2] * size) + region[1])
-        det = (
-            d[0],
-            d[1],
-            (x_min, y_min, x_max, y_max),
-            (x_max - x_min) * (y_max - y_min),
-            region,
-        )
-        # apply object filters
-        if filtered(det, objects_to_track, object_filters):
+
+    if not region_detections:
+        return detections
+
+    # compute the frame coordinates and areas for the whole batch of
+    # detections at once rather than once per detection in python
+    size = region[2] - region[0]
+    coords = np.array([d[2] for d in region_detections], dtype=np.float64) * size
+    coords[:, [0, 2]] += region[1]
+    coords[:, [1, 3]] += region[0]
+    # truncation via astype matches the previous per-value int() casts
+    int_coords = coords.astype(np.int32)
+    y_mins, x_mins, y_maxs, x_maxs = int_coords.T.tolist()
+    areas = (int_coords[:, 3] - int_coords[:, 1]) * (int_coords[:, 2] - int_coords[:, 0])
+
+    # apply the threshold filters to the whole batch at once as well
+    count = len(region_detections)
+    scores = np.array([d[1] for d in region_detections])
+    min_areas = np.zeros(count)
+    max_areas = np.full(count, np.inf)
+    min_scores = np.zeros(count)
+    tracked = np.zeros(count, np.bool_)
+    for i, d in enumerate(region_detections):
+        if not d[0] in objects_to_track:
             continue
-        detections.append(det)
+        tracked[i] = True
+        obj_settings = object_filters.get(d[0])
+        if not obj_settings is None:
+            min_areas[i] = obj_settings.min_area
+            max_areas[i] = obj_settings.max_area
+            min_scores[i] = obj_settings.min_score
+    keep = tracked & (areas >= min_areas) & (areas <= max_areas) & (scores >= min_scores)
+
+    for i in np.flatnonzero(keep):
+        obj_settings = object_filters.get(region_detections[i][0])
+        mask = None if obj_settings is None else obj_settings.mask
+        if not mask is None:
+            # compute the coordinates of the object and make sure
+            # the location isnt outside the bounds of the image (can happen from rounding)
+            y_location = min(y_maxs[i], mask.shape[0] - 1)
+            x_location = min(
+                int((x_maxs[i] - x_mins[i]) / 2.0) + x_mins[i], mask.shape[1] - 1
+            )
+
+            # if the object is in a masked location, don't add it to detected objects
+            if mask[y_location, x_location] == 0:
+                continue
+
+        detections.append(
+            (
+                region_detections[i][0],
+                region_detections[i][1],
+                (x_mins[i], y_mins[i], x_maxs[i], y_maxs[i]),
+                int(areas[i]),
+                region,
+            )
+        )
     return detections
 
 
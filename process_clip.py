@@ -21,7 +21,6 @@ from frigate.motion import MotionDetector
 from frigate.object_processing import CameraState
 from frigate.objects import ObjectTracker
 from frigate.util import (
-    EventsPerSecond,
     SharedMemoryFrameManager,
     draw_box_with_label,
 )
@@ -44,13 +43,16 @@ def get_frame_shape(source):
         "json",
         source,
     ]
-    p = sp.run(ffprobe_cmd, capture_output=True)
-    info = json.loads(p.stdout)
+    try:
+        p = sp.run(ffprobe_cmd, capture_output=True, timeout=10)
+        info = json.loads(p.stdout)
 
-    video_info = [s for s in info["streams"] if s["codec_type"] == "video"][0]
+        video_info = [s for s in info["streams"] if s["codec_type"] == "video"][0]
 
-    if video_info["height"] != 0 and video_info["width"] != 0:
-        return (video_info["height"], video_info["width"], 3)
+        if video_info["height"] != 0 and video_info["width"] != 0:
+            return (video_info["height"], video_info["width"], 3)
+    except (sp.TimeoutExpired, KeyError, IndexError, ValueError):
+        pass
 
     # fallback to using opencv if ffprobe didnt succeed
     video = cv2.VideoCapture(source)
@@ -76,9 +78,10 @@ class ProcessClip:
         self.camera_state = CameraState(self.camera_name, config, self.frame_manager)
 
     def load_frames(self):
-        fps = EventsPerSecond()
-        skipped_fps = EventsPerSecond()
+        fps = mp.Value("d", 0.0)
+        skipped_fps = mp.Value("d", 0.0)
         current_frame = mp.Value("d", 0.0)
+        frame_counter = mp.Value("Q", 0)
         frame_size = (
             self.camera_config.frame_shape_yuv[0]
             * self.camera_config.frame_shape_yuv[1]
@@ -95,6 +98,7 @@ class ProcessClip:
             fps,
             skipped_fps,
             current_frame,
+            frame_counter,
         )
         ffmpeg_process.wait()
         ffmpeg_process.communicate()